@@ -10,14 +10,31 @@ Features:
 """
 
 import argparse
+import functools
 import math
+import mmap
 import os
+import pickle
 import sys
 import hashlib
+import string
 import subprocess
 import textwrap
+import time
+from collections import Counter
+from types import MappingProxyType
 from typing import Tuple
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # pure-Python entropy fallback is used
+
+try:
+    import numba
+except ImportError:
+    numba = None  # pure-Python stats fallback is used
+
 # -------------------------------
 # Helper to install optional packages
 # -------------------------------
@@ -38,8 +55,11 @@ def ensure_package(package_name: str, import_name: str = None):
             print(f"Skipping {package_name}. Some features may not work.")
             return None
 
-# Optional libraries
-zxcvbn = ensure_package("zxcvbn")
+# Optional libraries: probed on first use, not at import, so plain
+# startup (--help, scripts, tests) pays no __import__/install-prompt cost.
+@functools.lru_cache(maxsize=None)
+def _get_zxcvbn():
+    return ensure_package("zxcvbn")
 
 # Only prompt for requests if user wants HIBP later
 requests = None  # will be loaded on demand if needed
@@ -48,22 +68,61 @@ requests = None  # will be loaded on demand if needed
 # Core Functions
 # -------------------------------
 
+# Maps every ASCII codepoint to its class bit (1 upper, 2 lower, 4 digit,
+# 8 special) so str.translate can classify the whole string in one C scan.
+_CLASS_TABLE = {ord(c): "\x01" for c in string.ascii_uppercase}
+_CLASS_TABLE.update({ord(c): "\x02" for c in string.ascii_lowercase})
+_CLASS_TABLE.update({ord(c): "\x04" for c in string.digits})
+_CLASS_TABLE.update({i: "\x08" for i in range(128) if i not in _CLASS_TABLE})
+
 def char_classes(password: str) -> Tuple[bool, bool, bool, bool]:
-    has_upper = any(c.isupper() for c in password)
-    has_lower = any(c.islower() for c in password)
-    has_digit = any(c.isdigit() for c in password)
-    has_special = any(not c.isalnum() for c in password)
-    return has_upper, has_lower, has_digit, has_special
+    if password.isascii():
+        # translate + set both run at C level; the set holds at most the
+        # four distinct class flags, which we then OR together.
+        bits = 0
+        for flag in set(password.translate(_CLASS_TABLE)):
+            bits |= ord(flag)
+        return bool(bits & 1), bool(bits & 2), bool(bits & 4), bool(bits & 8)
+    # Non-ASCII needs the unicode-aware per-character checks: one scan,
+    # early exit once every class has been seen.
+    bits = 0
+    for c in password:
+        if c.isupper(): bits |= 1
+        if c.islower(): bits |= 2
+        if c.isdigit(): bits |= 4
+        if not c.isalnum(): bits |= 8
+        if bits == 15:
+            break
+    return bool(bits & 1), bool(bits & 2), bool(bits & 4), bool(bits & 8)
+
+# Passwords up to this length use a precomputed -(c/L)*log2(c/L) table,
+# turning the entropy loop into lookups + a sum.
+_ENTROPY_LUT_MAXLEN = 256
+
+@functools.lru_cache(maxsize=None)
+def _entropy_row(length: int):
+    # Row of the entropy LUT for one password length: row[c] is the
+    # contribution of a character that occurs c times.
+    row = [0.0] * (length + 1)
+    for count in range(1, length + 1):
+        p = count / length
+        row[count] = -p * math.log2(p)
+    return row
 
 #MEASURES RANDOMNESS OF PASSWORD
 def shannon_entropy(password: str) -> float:
     if not password:
         return 0.0 #if empty password return 0 entropy
-    frequency = {} #store frequency of each character
-    for char in password:
-        frequency[char] = frequency.get(char, 0) + 1
-    entropy = 0.0
+    frequency = Counter(password) #C-level count of each character
     length = len(password)
+    if length <= _ENTROPY_LUT_MAXLEN:
+        row = _entropy_row(length)
+        return sum(row[count] for count in frequency.values()) * length
+    if np is not None:
+        counts = np.fromiter(frequency.values(), dtype=np.float64, count=len(frequency))
+        p = counts / length
+        return float(-(p * np.log2(p)).sum()) * length
+    entropy = 0.0
     for count in frequency.values():
         p = count / length
         entropy -= p * math.log2(p)
@@ -81,12 +140,42 @@ frequency.get(char, 0) → gets current count for character char, defaults to 0
 """
 #-------------------------------
 
-def simple_score(password: str) -> Tuple[int, str]:
-    length = len(password)
-    has_upper, has_lower, has_digit, has_special = char_classes(password)
-    classes = sum([has_upper, has_lower, has_digit, has_special])
-    entropy = shannon_entropy(password)
-
+if numba is not None and np is not None:
+    @numba.njit(cache=True)
+    def _fused_ascii_stats(buf):
+        # One native loop over the raw bytes: byte-frequency histogram for
+        # entropy plus the four class bits, no Python objects in the loop.
+        freq = np.zeros(256, dtype=np.uint32)
+        bits = 0
+        for b in buf:
+            freq[b] += 1
+            if 65 <= b <= 90: bits |= 1
+            elif 97 <= b <= 122: bits |= 2
+            elif 48 <= b <= 57: bits |= 4
+            else: bits |= 8
+        length = buf.size
+        entropy = 0.0
+        for count in freq:
+            if count:
+                p = count / length
+                entropy -= p * np.log2(p)
+        return entropy * length, bits
+else:
+    _fused_ascii_stats = None
+
+def password_stats(password: str) -> Tuple[float, Tuple[bool, bool, bool, bool]]:
+    """Entropy bits and character classes in a single pass.
+
+    Uses the Numba-compiled fused loop for ASCII passwords when available
+    (the hot path when scripting over millions of candidates); otherwise
+    falls back to the plain shannon_entropy/char_classes pair.
+    """
+    if _fused_ascii_stats is not None and password and password.isascii():
+        entropy, bits = _fused_ascii_stats(np.frombuffer(password.encode("ascii"), dtype=np.uint8))
+        return entropy, (bool(bits & 1), bool(bits & 2), bool(bits & 4), bool(bits & 8))
+    return shannon_entropy(password), char_classes(password)
+
+def _score_from(length: int, classes: int, entropy: float) -> Tuple[int, str]:
     score = 0
     if length >= 8: score += 1
     if length >= 12: score += 1
@@ -96,57 +185,336 @@ def simple_score(password: str) -> Tuple[int, str]:
     label = {0:"Very weak",1:"Weak",2:"Moderate",3:"Strong",4:"Very strong"}[min(score,4)]
     return score, label
 
-def check_local_wordlist(password: str, path: str) -> bool:
+def simple_score(password: str) -> Tuple[int, str]:
+    entropy, flags = password_stats(password)
+    return _score_from(len(password), sum(flags), entropy)
+
+@functools.lru_cache(maxsize=None)
+def _get_marisa():
+    return ensure_package("marisa-trie", "marisa_trie")
+
+@functools.lru_cache(maxsize=None)
+def _get_bloomfilter():
+    return ensure_package("pybloomfiltermmap3", "pybloomfilter")
+
+# Only bother with a Bloom prefilter for lists this big; small lists are
+# cheap to hold in memory outright.
+_BLOOM_MIN_BYTES = 16 * 1024 * 1024
+
+@functools.lru_cache(maxsize=4)
+def _load_bloom(path: str, mtime: float):
+    """Return an mmap-backed Bloom filter for a large wordlist, or None.
+
+    The filter is persisted next to the wordlist (<path>.bloom) so later
+    invocations open it in O(1); a negative answer then costs a few probed
+    bits instead of touching the full wordlist structure.
+    """
+    bloom_mod = _get_bloomfilter()
+    if bloom_mod is None:
+        return None
+    bloom_path = path + ".bloom"
+    if os.path.isfile(bloom_path) and os.path.getmtime(bloom_path) >= mtime:
+        return bloom_mod.BloomFilter.open(bloom_path)
+    # Stream the build: these lists are too big to hold in memory, which
+    # is the whole reason the filter exists. One pass to size the
+    # capacity, one to populate, never more than a line resident.
+    with open(path, "rb") as f:
+        count = sum(1 for _ in f)
+        f.seek(0)
+        bf = bloom_mod.BloomFilter(max(count, 1), 1e-4, bloom_path)
+        for line in f:
+            bf.add(line.rstrip(b"\r\n").decode("utf-8", "ignore"))
+    bf.sync()
+    return bf
+
+# Built wordlists keyed by (path, mtime) so an edited file is reloaded
+_WORDLIST_CACHE: dict = {}
+
+# Lists this big get their decode+split parallelised across cores
+_PARALLEL_BUILD_MIN_BYTES = 8 * 1024 * 1024
+
+def _parse_chunk(path: str, start: int, end: int) -> frozenset:
+    # Worker for the parallel build: parse one newline-aligned byte range.
+    with open(path, "rb") as f:
+        f.seek(start)
+        return frozenset(f.read(end - start).decode("utf-8", "ignore").splitlines())
+
+def _chunk_bounds(path: str, size: int, parts: int) -> list:
+    # Roughly equal byte offsets, each snapped forward to a line boundary.
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            f.seek(size * i // parts)
+            f.readline()
+            pos = min(f.tell(), size)
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    return bounds
+
+def _read_words(path: str):
+    size = os.path.getsize(path)
+    workers = os.cpu_count() or 1
+    if size >= _PARALLEL_BUILD_MIN_BYTES and workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import repeat
+        bounds = _chunk_bounds(path, size, workers)
+        with ProcessPoolExecutor(max_workers=len(bounds) - 1) as pool:
+            parts = pool.map(_parse_chunk, repeat(path), bounds[:-1], bounds[1:])
+            return frozenset().union(*parts)
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8", "ignore").splitlines()
+
+def _load_persisted(path: str, mtime: float, marisa):
+    # Reload a previously built structure (<path>.marisa or <path>.pkl)
+    # if it is at least as new as the wordlist itself.
+    if marisa:
+        trie_path = path + ".marisa"
+        if os.path.isfile(trie_path) and os.path.getmtime(trie_path) >= mtime:
+            trie = marisa.Trie()
+            trie.mmap(trie_path)
+            return trie
+        return None
+    pkl_path = path + ".pkl"
+    if os.path.isfile(pkl_path) and os.path.getmtime(pkl_path) >= mtime:
+        try:
+            with open(pkl_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None  # stale/corrupt cache, rebuild below
+    return None
+
+def _persist_wordlist(path: str, built, marisa) -> None:
+    try:
+        if marisa:
+            built.save(path + ".marisa")
+        else:
+            with open(path + ".pkl", "wb") as f:
+                pickle.dump(built, f, protocol=5)
+    except OSError:
+        pass  # e.g. read-only directory; the in-memory cache still helps
+
+def _load_wordlist(path: str):
+    """Read a wordlist once and build an O(1)/O(length) membership structure.
+
+    Uses a marisa-trie (compact, C-implemented) when available, otherwise
+    falls back to a plain frozenset. Cached by (path, mtime) so repeated
+    checks (e.g. the interactive loop) never re-read an unchanged file,
+    and persisted next to the wordlist so fresh CLI invocations skip the
+    build entirely. Multi-MB lists are decoded and split across all cores.
+    """
+    mtime = os.path.getmtime(path)
+    key = (path, mtime)
+    cached = _WORDLIST_CACHE.get(key)
+    if cached is not None:
+        return cached
+    marisa = _get_marisa()
+    built = _load_persisted(path, mtime, marisa)
+    if built is None:
+        words = _read_words(path)
+        built = marisa.Trie(words) if marisa else frozenset(words)
+        _persist_wordlist(path, built, marisa)
+    _WORDLIST_CACHE.clear()  # keep at most one list resident
+    _WORDLIST_CACHE[key] = built
+    return built
+
+# Fixed-size record: one raw SHA-1 digest per wordlist entry
+_IDX_RECORD = 20
+
+def build_wordlist_index(path: str) -> str:
+    """Write a sorted binary SHA-1 index (<path>.idx) for a wordlist.
+
+    The same hash-bucketing idea HIBP uses server-side: the index is a
+    sorted array of 20-byte digests, so a later check is a binary search
+    over an mmap (a handful of page faults) instead of loading the whole
+    list. Meant for lists too big to hold as a set in RAM.
+    """
     if not os.path.isfile(path):
         raise FileNotFoundError(path)
-    password_stripped = password.rstrip("\n")
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+    digests = []
+    with open(path, "rb") as f:
         for line in f:
-            if line.rstrip("\r\n") == password_stripped:
+            word = line.rstrip(b"\r\n")
+            if word:
+                digests.append(hashlib.sha1(word, usedforsecurity=False).digest())
+    digests.sort()
+    idx_path = path + ".idx"
+    with open(idx_path, "wb") as f:
+        f.write(b"".join(digests))
+    return idx_path
+
+def _check_indexed(password: str, idx_path: str) -> bool:
+    digest = hashlib.sha1(password.encode("utf-8"), usedforsecurity=False).digest()
+    with open(idx_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lo, hi = 0, len(mm) // _IDX_RECORD
+        while lo < hi:
+            mid = (lo + hi) // 2
+            rec = mm[mid * _IDX_RECORD:(mid + 1) * _IDX_RECORD]
+            if rec < digest:
+                lo = mid + 1
+            elif rec > digest:
+                hi = mid
+            else:
                 return True
     return False
 
-def hibp_pwned_count(password: str) -> int:
-    global requests
+def _mmap_scan(password: str, path: str) -> bool:
+    """grep -F-style scan of the raw wordlist bytes via mmap.
+
+    No per-line str objects or UTF-8 decode; bytes.find is a memchr-class
+    scan and the kernel handles prefetch. Used for one-shot checks on
+    lists too large to be worth building into a set.
+    """
+    needle = password.encode("utf-8")
+    if not needle:
+        return False
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end_of_file = len(mm)
+        idx = mm.find(needle)
+        while idx != -1:
+            end = idx + len(needle)
+            # a real match sits on its own line (allowing \r\n endings)
+            if (idx == 0 or mm[idx - 1:idx] == b"\n") and \
+               (end == end_of_file or mm[end:end + 1] in (b"\n", b"\r")):
+                return True
+            idx = mm.find(needle, idx + 1)
+    return False
+
+def check_local_wordlist(password: str, path: str) -> bool:
+    if not os.path.isfile(path):
+        raise FileNotFoundError(path)
+    password = password.rstrip("\n")
+    size = os.path.getsize(path)
+    # A fresh --build-index result is exact and O(log N); prefer it over
+    # the Bloom filter, which would otherwise trigger its whole-file
+    # build and still need a confirming scan on hits.
+    idx_path = path + ".idx"
+    if os.path.isfile(idx_path) and os.path.getmtime(idx_path) >= os.path.getmtime(path):
+        return _check_indexed(password, idx_path)
+    if size >= _BLOOM_MIN_BYTES:
+        bf = _load_bloom(path, os.path.getmtime(path))
+        if bf is not None:
+            if password not in bf:
+                return False  # definite miss, no need to touch the wordlist
+            return _mmap_scan(password, path)  # confirm the rare possible hit
+        return _mmap_scan(password, path)  # too big to hold as a set
+    return password in _load_wordlist(path)
+
+@functools.lru_cache(maxsize=128)
+def _sha1_hex(password: str) -> str:
+    """Uppercase SHA-1 of the password, cached per password.
+
+    The interactive loop often re-checks the same string; hashing (and
+    encoding) it once covers the HIBP bucket key here and any future
+    local hash-based lookup. The digest is only a bucket key, not a
+    security primitive, so usedforsecurity=False lets OpenSSL pick its
+    fastest (e.g. SHA-NI) implementation.
+    """
+    return hashlib.sha1(password.encode("utf-8"), usedforsecurity=False).hexdigest().upper()
+
+# Persistent HIBP session: keeps the TLS connection alive across checks
+# instead of paying a fresh handshake per password.
+_HIBP_SESSION = None
+_HIBP_CONCURRENCY = 16
+
+def _hibp_session():
+    global requests, _HIBP_SESSION
     if requests is None:
         requests = ensure_package("requests")
         if requests is None:
-            print("Cannot perform HIBP check because 'requests' is missing.")
-            return -1  # indicate check not performed
-    sha1 = hashlib.sha1(password.encode("utf-8")).hexdigest().upper()
+            return None
+    if _HIBP_SESSION is None:
+        _HIBP_SESSION = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=_HIBP_CONCURRENCY, pool_maxsize=_HIBP_CONCURRENCY)
+        _HIBP_SESSION.mount("https://", adapter)
+    return _HIBP_SESSION
+
+def hibp_pwned_count(password: str) -> int:
+    session = _hibp_session()
+    if session is None:
+        print("Cannot perform HIBP check because 'requests' is missing.")
+        return -1  # indicate check not performed
+    sha1 = _sha1_hex(password)
     prefix, suffix = sha1[:5], sha1[5:]
     url = f"https://api.pwnedpasswords.com/range/{prefix}"
-    resp = requests.get(url, timeout=10)
+    resp = session.get(url, timeout=10)
     if resp.status_code != 200:
         raise RuntimeError(f"HIBP API error: {resp.status_code}")
-    for line in resp.text.splitlines():
-        h, count = line.split(":")
-        if h == suffix:
-            return int(count)
-    return 0
+    # We only need one suffix out of ~800 lines: scan the raw bytes for it
+    # instead of decoding and splitting the whole response.
+    body = resp.content
+    needle = (suffix + ":").encode("ascii")
+    if body.startswith(needle):
+        start = len(needle)
+    else:
+        idx = body.find(b"\n" + needle)
+        if idx == -1:
+            return 0
+        start = idx + 1 + len(needle)
+    end = body.find(b"\n", start)
+    if end == -1:
+        end = len(body)
+    return int(body[start:end])  # int() ignores the trailing \r
+
+def _hibp_many(passwords):
+    """Query HIBP for many passwords concurrently over the shared session.
+
+    Returns {password: count} (or {password: error_message} on failure).
+    Wall time drops to roughly max(latency) per batch of
+    _HIBP_CONCURRENCY instead of the sum of serial round-trips.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Resolve the session (and the ensure_package prompt behind it) once,
+    # here on the main thread - the lazy init of the module globals is
+    # not safe to race from the pool workers.
+    if _hibp_session() is None:
+        print("Cannot perform HIBP check because 'requests' is missing.")
+        return {pw: -1 for pw in passwords}  # checks not performed
+
+    def one(pw):
+        try:
+            return hibp_pwned_count(pw)
+        except Exception as e:
+            return str(e)
+
+    workers = min(_HIBP_CONCURRENCY, max(len(passwords), 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(passwords, pool.map(one, passwords)))
+
 
+# Cached analyses are refreshed after this long so HIBP counts don't go stale
+_ANALYSIS_TTL_SECONDS = 600
 
-def analyze_password(password: str, wordlist: str | None = None, hibp: bool = False, verbose: bool = False) -> dict:
+def analyze_password(password: str, wordlist: str | None = None, hibp: bool = False, verbose: bool = False):
+    """Analyze a password; results are memoised (read-only mapping).
+
+    The interactive loop often re-checks the same string or variants of
+    it, so the full analysis (entropy, zxcvbn, wordlist, HIBP) is cached
+    per argument tuple, with a TTL bucket so network-backed results are
+    refreshed every few minutes.
+    """
+    ttl_bucket = int(time.time() // _ANALYSIS_TTL_SECONDS)
+    return _analyze_cached(password, wordlist, hibp, verbose, ttl_bucket)
+
+@functools.lru_cache(maxsize=64)
+def _analyze_cached(password: str, wordlist: str | None, hibp: bool, verbose: bool, ttl_bucket: int):
     out = {} #result dictionary
     out["password_length"] = len(password)
-    has_upper, has_lower, has_digit, has_special = char_classes(password)
+    entropy, (has_upper, has_lower, has_digit, has_special) = password_stats(password)
     out["has_upper"] = has_upper
     out["has_lower"] = has_lower
     out["has_digit"] = has_digit
     out["has_special"] = has_special
-    out["entropy_bits"] = round(shannon_entropy(password), 2)
-    score, label = simple_score(password)
+    out["entropy_bits"] = round(entropy, 2)
+    score, label = _score_from(len(password), sum([has_upper, has_lower, has_digit, has_special]), entropy)
     out["simple_score"] = score
     out["label"] = label
 
-    if zxcvbn:
-        try:
-            zx = zxcvbn.zxcvbn(password)
-            out["zxcvbn_score"] = zx.get("score")
-            out["zxcvbn_feedback"] = zx.get("feedback", {})
-        except Exception:
-            out["zxcvbn_score"] = None
-
+    # Breach checks first: if the password is already known-compromised
+    # the verdict is settled and the (comparatively slow) zxcvbn analysis
+    # adds nothing.
     if wordlist:
         try:
             out["found_in_wordlist"] = check_local_wordlist(password, wordlist)
@@ -160,10 +528,21 @@ def analyze_password(password: str, wordlist: str | None = None, hibp: bool = Fa
         except Exception as e:
             out["hibp_error"] = str(e)
 
+    compromised = out.get("found_in_wordlist") is True or out.get("hibp_count", 0) > 0
+    zxcvbn = None if compromised else _get_zxcvbn()
+    if zxcvbn:
+        try:
+            zx = zxcvbn.zxcvbn(password)
+            out["zxcvbn_score"] = zx.get("score")
+            out["zxcvbn_feedback"] = zx.get("feedback", {})
+        except Exception:
+            out["zxcvbn_score"] = None
+
     if verbose:
         out["complex"] = {"classes_count": sum([has_upper, has_lower, has_digit, has_special])}
 
-    return out
+    # Read-only view: cached results must not be mutated by callers
+    return MappingProxyType(out)
 
 def print_report(password: str, res: dict):
     print("\n=== Password analysis ===")
@@ -220,6 +599,24 @@ def interactive_loop(args):
             break
 
 
+def batch_loop(args):
+    with open(args.input, "r", encoding="utf-8", errors="ignore") as f:
+        passwords = [line.rstrip("\r\n") for line in f if line.strip()]
+    # Fire the network-bound HIBP lookups concurrently up front, then
+    # analyze each password with the prefetched counts.
+    hibp_counts = _hibp_many(passwords) if args.hibp else {}
+    for password in passwords:
+        # dict() copy: analyze_password returns a read-only cached mapping
+        res = dict(analyze_password(password, wordlist=args.wordlist, hibp=False, verbose=args.verbose))
+        if args.hibp:
+            result = hibp_counts.get(password)
+            if isinstance(result, int):
+                res["hibp_count"] = result
+            else:
+                res["hibp_error"] = result
+        print_report(password, res)
+
+
 def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Password Strength Checker (interactive + CLI)",
@@ -231,11 +628,25 @@ def main(argv=None):
         """),
     )
     parser.add_argument("--password", "-p", help="Password to check (careful: command-line history may record this)")
+    parser.add_argument("--input", "-i", help="File with one password per line; checks them all (batch mode)")
     parser.add_argument("--wordlist", "-w", help="Path to a local wordlist file to check against")
+    parser.add_argument("--build-index", action="store_true",
+                        help="Build a sorted hash index next to --wordlist for fast checks on huge lists, then exit")
     parser.add_argument("--hibp", action="store_true", help="Check password against HaveIBeenPwned (requires requests)")
     parser.add_argument("--verbose", action="store_true", help="Verbose / debug output")
     args = parser.parse_args(argv)
 
+    if args.build_index:
+        if not args.wordlist:
+            parser.error("--build-index requires --wordlist")
+        idx_path = build_wordlist_index(args.wordlist)
+        print(f"Index written to {idx_path}")
+        return
+
+    if args.input:
+        batch_loop(args)
+        return
+
     if args.password:
         res = analyze_password(args.password, wordlist=args.wordlist, hibp=args.hibp, verbose=args.verbose)
         print_report(args.password, res)